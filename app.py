@@ -1,10 +1,15 @@
+# Patch blocking sockets before anything imports requests
+from gevent import monkey
+monkey.patch_all()
+
 import os
 import logging
-from flask import Flask, jsonify, request, render_template
+import orjson
+from flask import Flask, Response, request, render_template
 from scraper import RobloxScraper
 
 # Configure logging
-logging.basicConfig(level=logging.DEBUG)
+logging.basicConfig(level=os.environ.get('LOG_LEVEL', 'INFO').upper())
 logger = logging.getLogger(__name__)
 
 # Create Flask app
@@ -14,15 +19,24 @@ app.secret_key = os.environ.get("SESSION_SECRET", "dev-secret-key")
 # Initialize scraper
 scraper = RobloxScraper()
 
+def ojson(data, status=200):
+    """Build a JSON response, serialized with orjson"""
+    return Response(orjson.dumps(data), status=status, mimetype='application/json')
+
+# Maximum number of user IDs accepted by the batch endpoint
+MAX_BATCH_SIZE = 100
+
+# Largest user ID accepted; orjson can't serialize integers beyond int64
+MAX_USER_ID = 2**63 - 1
+
 @app.route('/')
 def index():
     """Render the API documentation page"""
     return render_template('index.html')
 
-@app.route('/api/followers/<int:user_id>')
-def get_followers(user_id):
+def _handle(user_id):
     """
-    Get follower count for a Roblox user
+    Look up the follower count for a Roblox user and build the response
     
     Args:
         user_id (int): Roblox user ID
@@ -30,47 +44,54 @@ def get_followers(user_id):
     Returns:
         JSON response with follower count or error
     """
-    logger.info(f"Received request for user ID: {user_id}")
+    logger.info("Received request for user ID: %s", user_id)
     
     try:
         # Validate user ID
-        if user_id <= 0:
-            logger.warning(f"Invalid user ID: {user_id}")
-            return jsonify({
+        if user_id <= 0 or user_id > MAX_USER_ID:
+            logger.warning("Invalid user ID: %s", user_id)
+            return ojson({
                 'error': 'Invalid user ID',
-                'message': 'User ID must be a positive integer'
-            }), 400
+                'message': 'User ID must be a positive 64-bit integer'
+            }, 400)
         
         # Get follower count
         result = scraper.get_user_followers(user_id)
         
         if result['success']:
-            logger.info(f"Successfully scraped followers for user {user_id}: {result['followers']}")
-            return jsonify({
+            logger.info("Successfully scraped followers for user %s: %s", user_id, result['followers'])
+            return ojson({
                 'user_id': user_id,
                 'followers': result['followers'],
                 'username': result.get('username', 'Unknown'),
                 'timestamp': result.get('timestamp')
             })
         else:
-            logger.error(f"Failed to scrape user {user_id}: {result['error']}")
-            return jsonify({
+            logger.error("Failed to scrape user %s: %s", user_id, result['error'])
+            return ojson({
                 'error': result['error'],
                 'user_id': user_id
-            }), 404
+            }, 404)
             
-    except ValueError as e:
-        logger.error(f"ValueError for user {user_id}: {str(e)}")
-        return jsonify({
-            'error': 'Invalid user ID format',
-            'message': str(e)
-        }), 400
     except Exception as e:
-        logger.error(f"Unexpected error for user {user_id}: {str(e)}")
-        return jsonify({
+        logger.error("Unexpected error for user %s: %s", user_id, e)
+        return ojson({
             'error': 'Internal server error',
             'message': 'An unexpected error occurred while processing your request'
-        }), 500
+        }, 500)
+
+@app.route('/api/followers/<int:user_id>')
+def get_followers(user_id):
+    """
+    Get follower count for a Roblox user
+    
+    Args:
+        user_id (int): Roblox user ID
+        
+    Returns:
+        JSON response with follower count or error
+    """
+    return _handle(user_id)
 
 @app.route('/api/followers')
 def get_followers_query():
@@ -83,22 +104,82 @@ def get_followers_query():
     Returns:
         JSON response with follower count or error
     """
-    user_id = request.args.get('user_id')
-    
-    if not user_id:
-        return jsonify({
+    if not request.args.get('user_id'):
+        return ojson({
             'error': 'Missing user_id parameter',
             'message': 'Please provide a user_id query parameter'
-        }), 400
+        }, 400)
     
-    try:
-        user_id = int(user_id)
-        return get_followers(user_id)
-    except ValueError:
-        return jsonify({
+    # Flask returns None when the value can't be converted to an int
+    user_id = request.args.get('user_id', type=int)
+    if user_id is None:
+        return ojson({
             'error': 'Invalid user_id format',
             'message': 'user_id must be a valid integer'
-        }), 400
+        }, 400)
+    
+    return _handle(user_id)
+
+@app.route('/api/followers/batch', methods=['POST'])
+def get_followers_batch():
+    """
+    Get follower counts for several Roblox users
+    
+    JSON Body:
+        userIds (list[int]): Roblox user IDs
+        
+    Returns:
+        JSON object keyed by user ID with a follower count or error for each
+    """
+    data = request.get_json(silent=True)
+    user_ids = data.get('userIds') if isinstance(data, dict) else None
+    
+    if not isinstance(user_ids, list) or not user_ids:
+        return ojson({
+            'error': 'Missing userIds',
+            'message': 'Please provide a JSON body with a non-empty userIds list'
+        }, 400)
+    
+    if len(user_ids) > MAX_BATCH_SIZE:
+        return ojson({
+            'error': 'Too many user IDs',
+            'message': f'A batch may contain at most {MAX_BATCH_SIZE} user IDs'
+        }, 400)
+    
+    if any(isinstance(user_id, bool) or not isinstance(user_id, int)
+           or user_id <= 0 or user_id > MAX_USER_ID
+           for user_id in user_ids):
+        return ojson({
+            'error': 'Invalid user ID',
+            'message': 'All user IDs must be positive 64-bit integers'
+        }, 400)
+    
+    logger.info("Received batch request for %s user IDs", len(user_ids))
+    
+    try:
+        results = scraper.get_users_followers(user_ids)
+        
+        response = {}
+        for user_id, result in results.items():
+            if result['success']:
+                response[str(user_id)] = {
+                    'user_id': user_id,
+                    'followers': result['followers'],
+                    'username': result.get('username', 'Unknown'),
+                    'timestamp': result.get('timestamp')
+                }
+            else:
+                response[str(user_id)] = {
+                    'error': result['error'],
+                    'user_id': user_id
+                }
+        return ojson(response)
+    except Exception as e:
+        logger.error("Unexpected error for batch %s: %s", user_ids, e)
+        return ojson({
+            'error': 'Internal server error',
+            'message': 'An unexpected error occurred while processing your request'
+        }, 500)
 
 @app.route('/api/cache/clear')
 def clear_cache():
@@ -106,42 +187,39 @@ def clear_cache():
     try:
         scraper.clear_cache()
         logger.info("Cache cleared successfully")
-        return jsonify({
+        return ojson({
             'message': 'Cache cleared successfully'
         })
     except Exception as e:
-        logger.error(f"Error clearing cache: {str(e)}")
-        return jsonify({
+        logger.error("Error clearing cache: %s", e)
+        return ojson({
             'error': 'Failed to clear cache',
             'message': str(e)
-        }), 500
+        }, 500)
 
 @app.route('/api/cache/stats')
 def cache_stats():
     """Get cache statistics"""
     try:
         stats = scraper.get_cache_stats()
-        return jsonify(stats)
+        return ojson(stats)
     except Exception as e:
-        logger.error(f"Error getting cache stats: {str(e)}")
-        return jsonify({
+        logger.error("Error getting cache stats: %s", e)
+        return ojson({
             'error': 'Failed to get cache stats',
             'message': str(e)
-        }), 500
+        }, 500)
 
 @app.errorhandler(404)
 def not_found(error):
-    return jsonify({
+    return ojson({
         'error': 'Endpoint not found',
         'message': 'The requested endpoint does not exist'
-    }), 404
+    }, 404)
 
 @app.errorhandler(500)
 def internal_error(error):
-    return jsonify({
+    return ojson({
         'error': 'Internal server error',
         'message': 'An unexpected error occurred'
-    }), 500
-
-if __name__ == '__main__':
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    }, 500)
@@ -0,0 +1,17 @@
+"""
+Gunicorn configuration
+
+Start the app with:
+    gunicorn -c gunicorn_conf.py main:app
+"""
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+
+# gevent workers let the blocking Roblox requests yield to each other, so
+# each worker keeps many requests in flight at once
+worker_class = 'gevent'
+workers = os.cpu_count() or 1
+worker_connections = 1000
+keepalive = 75
+timeout = 30
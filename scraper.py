@@ -1,13 +1,111 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import re
+import html
 import time
 import logging
-from bs4 import BeautifulSoup
-from datetime import datetime, timedelta
-from typing import Dict, Any, Optional
+import orjson
+import concurrent.futures
+from threading import Lock
+from cachetools import TTLCache
+import lxml.html
+from lxml.cssselect import CSSSelector
+from typing import Dict, Any, List, Optional
 
 logger = logging.getLogger(__name__)
 
+# Profile page selectors, combined so each lookup is a single tree walk
+USERNAME_SELECTOR = CSSSelector(', '.join([
+    'h1[data-testid="profile-display-name"]',
+    '.profile-display-name',
+    '.profile-name h1',
+    'h1.profile-name',
+    '.header-title h1',
+    '.profile-header h1',
+    '.profile-card h1'
+]))
+
+FOLLOWER_SELECTOR = CSSSelector(', '.join([
+    '[data-testid="followers-count"]',
+    '[data-testid="follower-count"]',
+    '.followers-count',
+    '.follower-count',
+    '.profile-stats-followers',
+    '.followers .stat-value',
+    '.stat-followers .stat-value',
+    '.profile-stat-followers',
+    '[class*="follower"] .text-label',
+    '[class*="follower"] .font-header-2'
+]))
+
+# Follower count patterns, compiled once at import. The script pattern
+# accepts exactly the followersCount/followers/followerCount keys (quoted
+# JSON keys, or JS keys followed by a quote) that were matched one by one.
+FOLLOWER_SCRIPT_RE = re.compile(
+    r'(?:"[Ff]ollowers(?:Count)?"|"[Ff]ollowerCount"|(?:followersCount|followers|FollowersCount)["\'])'
+    r'\s*:\s*(?P<count>\d+)'
+)
+FOLLOWER_SCRIPT_BYTES_RE = re.compile(FOLLOWER_SCRIPT_RE.pattern.encode())
+
+FOLLOWER_TEXT_RES = [re.compile(p) for p in (
+    r'(\d+(?:,\d+)*)\s*[Ff]ollowers?',
+    r'[Ff]ollowers?:\s*(\d+(?:,\d+)*)',
+    r'(\d+(?:,\d+)*)\s*people\s+follow',
+    r'(\d+(?:,\d+)*)\s*[Ff]ollowing\s+you',
+    r'(\d+(?:\.\d*)?[KkMmBb]?)\s*[Ff]ollowers?'
+)]
+
+FOLLOWER_CONTEXT_RES = [re.compile(p) for p in (
+    r'(?i:followers?|following)[^\d]*(\d+(?:,\d+)*|\d+(?:\.\d+)?[kmb]?)',
+    r'(\d+(?:,\d+)*|\d+(?:\.\d+)?[kmb]?)[^\d]*(?i:followers?|following)'
+)]
+
+NUMBER_COMMA_RE = re.compile(r'\b(\d{1,3}(?:,\d{3})+)\b')  # Numbers with commas (like 1,234)
+NUMBER_SUFFIX_RE = re.compile(r'\b(\d+(?:\.\d+)?[KkMmBb])\b')  # Numbers with K/M/B suffix
+NUMBER_TOKEN_RE = re.compile(r'\d[\d,]*(?:\.\d+)?[KkMmBb]?')
+
+# Text nodes a visitor would actually see on the page
+VISIBLE_TEXT_XPATH = '//text()[not(ancestor::script) and not(ancestor::style)]'
+
+# Multipliers for k, m, b suffixes on follower counts
+NUMBER_MULTIPLIERS = {'k': 1000, 'm': 1000000, 'b': 1000000000}
+
+# Username sources in the page head, matched directly on the raw bytes
+TITLE_RE = re.compile(rb'<title[^>]*>([^<]{1,200})</title>', re.I)
+# (the content value runs to its matching quote, so apostrophes inside a
+# double-quoted value such as "Builderman's Profile" are kept)
+META_DESC_RE = re.compile(rb'<meta\s+name=["\']description["\']\s+content=(["\'])(?P<content>.{1,300}?)\1', re.I)
+OG_TITLE_RE = re.compile(rb'<meta\s+property=["\']og:title["\']\s+content=(["\'])(?P<content>.{1,300}?)\1', re.I)
+
+# How much of the page is searched by the username head patterns
+HEAD_SCAN_BYTES = 8192
+
+# Shared API worker pool size: two calls (username and followers) for each of
+# the 1000 connections a gevent worker accepts (see gunicorn_conf.py)
+API_POOL_SIZE = 2000
+
+# Upper bound on workers for a single batch request's own executor
+BATCH_MAX_WORKERS = 32
+
+# Longest wait, in seconds, honoured from a Retry-After header
+MAX_RETRY_AFTER = 2
+
+# Chunk size used when streaming profile pages
+STREAM_CHUNK_SIZE = 16384
+
+# How much of the page head is searched for the "User not found" marker
+NOT_FOUND_SCAN_BYTES = 4096
+
+class CappedRetry(Retry):
+    """Retry policy that waits at most MAX_RETRY_AFTER for a Retry-After header"""
+    
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, MAX_RETRY_AFTER)
+
 class RobloxScraper:
     def __init__(self):
         """
@@ -15,18 +113,51 @@ class RobloxScraper:
         """
         self.session = requests.Session()
         
+        # Keep a large pool of persistent connections to the Roblox hosts so
+        # concurrent requests reuse TCP/TLS sessions instead of reconnecting.
+        # Rate limits and gateway errors are retried with exponential backoff,
+        # honouring Retry-After (capped) when Roblox sends it.
+        adapter = HTTPAdapter(
+            pool_connections=64,
+            pool_maxsize=256,
+            max_retries=CappedRetry(
+                total=2,
+                backoff_factor=0.5,
+                status_forcelist=[429, 502, 503, 504],
+                allowed_methods=frozenset(['GET']),
+                respect_retry_after_header=True,
+                raise_on_status=False
+            )
+        )
+        self.session.mount('https://', adapter)
+        
         # Set headers to mimic a real browser
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
+            'Accept-Encoding': 'gzip, deflate, br',
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
         })
         
         self.base_url = "https://www.roblox.com/users/{}/profile"
         
+        # Worker pool for overlapping the Roblox API calls. The session
+        # headers above must not be changed after this point, since the
+        # session is shared between the pool threads.
+        self._pool = concurrent.futures.ThreadPoolExecutor(max_workers=API_POOL_SIZE)
+        
+        # Short-lived caches in front of the Roblox API. Users that came back
+        # as 404 are remembered briefly so repeated lookups of invalid IDs
+        # don't reach Roblox at all.
+        self._name_cache = TTLCache(maxsize=10_000, ttl=60)
+        self._foll_cache = TTLCache(maxsize=10_000, ttl=30)
+        self._missing_cache = TTLCache(maxsize=10_000, ttl=10)
+        self._lock = Lock()
+        
+        # (time, ISO string) of the last formatted timestamp, see _timestamp
+        self._ts_cache = (0.0, '')
 
     
     def get_user_followers(self, user_id: int) -> Dict[str, Any]:
@@ -39,93 +170,203 @@ class RobloxScraper:
         Returns:
             Dictionary with success status, follower count, and other data
         """
+        return self.get_users_followers([user_id])[user_id]
+    
+    def get_users_followers(self, user_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """
+        Get follower counts for several Roblox users at once
+        
+        Usernames are resolved with a single batch request while each
+        user's follower count (including any profile scrape fallback) is
+        fetched concurrently.
+        
+        Args:
+            user_ids: Roblox user IDs
+            
+        Returns:
+            Dictionary keyed by user ID, each value shaped like the result
+            of get_user_followers
+        """
+        user_ids = list(dict.fromkeys(user_ids))
+        with self._lock:
+            missing = {user_id for user_id in user_ids if user_id in self._missing_cache}
+        pending = [user_id for user_id in user_ids if user_id not in missing]
+        
+        # Batches fan out on their own executor so they don't queue the
+        # single-user lookups on the shared pool behind them
+        if len(pending) > 1:
+            pool = concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(BATCH_MAX_WORKERS, len(pending) + 1)
+            )
+        else:
+            pool = self._pool
+        
+        try:
+            # Get user info from Roblox API, all calls in parallel. The
+            # username task is submitted first so the per-user tasks can
+            # safely wait on it.
+            username_future = None
+            result_futures = {}
+            if pending:
+                username_future = pool.submit(self._get_usernames_from_api, pending)
+                for user_id in pending:
+                    result_futures[user_id] = pool.submit(
+                        self._fetch_user_result, user_id, username_future
+                    )
+            usernames = username_future.result() if username_future else {}
+            
+            results = {}
+            for user_id in user_ids:
+                if user_id in missing:
+                    results[user_id] = {
+                        'success': False,
+                        'error': 'User not found',
+                        'user_id': user_id
+                    }
+                    continue
+                
+                result = result_futures[user_id].result()
+                # Prefer the API username over the one scraped from the page
+                if result['success'] or 'username' in result:
+                    result['username'] = usernames.get(user_id) or result.get('username') or 'Unknown'
+                results[user_id] = result
+            return results
+        finally:
+            if pool is not self._pool:
+                pool.shutdown(wait=False)
+    
+    def _fetch_user_result(self, user_id: int,
+                           username_future: concurrent.futures.Future) -> Dict[str, Any]:
+        """
+        Get the follower count for one user, scraping the profile if the API
+        fails. The username is filled in by the caller.
+        """
         try:
-            # Get user info from Roblox API (no caching)
-            username = self._get_username_from_api(user_id)
             followers = self._get_followers_from_api(user_id)
             
-            if username and followers is not None:
+            if followers is not None:
                 result = {
                     'success': True,
                     'user_id': user_id,
-                    'username': username,
                     'followers': followers,
-                    'timestamp': datetime.now().isoformat()
+                    'timestamp': self._timestamp()
                 }
                 return result
             
-            # Fallback to web scraping if API fails
+            # The API lookups may have just found that the user doesn't exist,
+            # in which case there is no profile page worth scraping
+            username_future.result()
+            with self._lock:
+                missing = user_id in self._missing_cache
+            if missing:
+                return {
+                    'success': False,
+                    'error': 'User not found',
+                    'user_id': user_id
+                }
+            
+            # Fallback to web scraping only if the followers API fails
             return self._scrape_user_profile(user_id)
         
         except requests.exceptions.Timeout:
-            logger.error(f"Timeout while getting user {user_id}")
+            logger.error("Timeout while getting user %s", user_id)
             return {
                 'success': False,
                 'error': 'Request timeout - Roblox servers may be slow',
                 'user_id': user_id
             }
         except requests.exceptions.ConnectionError:
-            logger.error(f"Connection error while getting user {user_id}")
+            logger.error("Connection error while getting user %s", user_id)
             return {
                 'success': False,
                 'error': 'Unable to connect to Roblox servers',
                 'user_id': user_id
             }
         except Exception as e:
-            logger.error(f"Unexpected error while getting user {user_id}: {str(e)}")
+            logger.error("Unexpected error while getting user %s: %s", user_id, e)
             return {
                 'success': False,
                 'error': 'An unexpected error occurred',
                 'user_id': user_id
             }
     
-    def _get_username_from_api(self, user_id: int) -> Optional[str]:
-        """Get username using Roblox API"""
+    def _timestamp(self) -> str:
+        """Current UTC time as an ISO 8601 string, reformatted at most once a second"""
+        now = time.time()
+        ts_cache = self._ts_cache
+        if now - ts_cache[0] >= 1:
+            ts_cache = (now, time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(now)))
+            self._ts_cache = ts_cache
+        return ts_cache[1]
+    
+    def _get_usernames_from_api(self, user_ids: List[int]) -> Dict[int, str]:
+        """Get usernames for several users with one Roblox API request"""
+        usernames = {}
+        with self._lock:
+            for user_id in user_ids:
+                username = self._name_cache.get(user_id)
+                if username is not None:
+                    usernames[user_id] = username
+        
+        uncached = [user_id for user_id in user_ids if user_id not in usernames]
+        if not uncached:
+            return usernames
+        
         try:
-            url = f"https://users.roblox.com/v1/users/{user_id}"
-            response = self.session.get(url, timeout=10)
+            url = "https://users.roblox.com/v1/users"
+            response = self.session.post(url, json={
+                'userIds': uncached,
+                'excludeBannedUsers': False
+            }, timeout=10)
             
             if response.status_code == 200:
-                data = response.json()
-                return data.get('name', data.get('displayName'))
-            elif response.status_code == 404:
-                return None
+                data = orjson.loads(response.content)
+                with self._lock:
+                    for user in data.get('data', []):
+                        username = user.get('name', user.get('displayName'))
+                        if username:
+                            usernames[user['id']] = username
+                            self._name_cache[user['id']] = username
+                    # Users left out of the response don't exist
+                    for user_id in uncached:
+                        if user_id not in usernames:
+                            self._missing_cache[user_id] = True
             else:
-                logger.warning(f"API returned status {response.status_code} for user {user_id}")
-                return None
+                logger.warning("API returned status %s for users %s", response.status_code, uncached)
         except Exception as e:
-            logger.warning(f"Failed to get username from API for user {user_id}: {str(e)}")
-            return None
+            logger.warning("Failed to get usernames from API for users %s: %s", uncached, e)
+        return usernames
     
     def _get_followers_from_api(self, user_id: int) -> Optional[int]:
         """Get follower count using Roblox API"""
+        with self._lock:
+            followers = self._foll_cache.get(user_id)
+        if followers is not None:
+            return followers
+        
         try:
             # Try the friends API first
             url = f"https://friends.roblox.com/v1/users/{user_id}/followers/count"
             response = self.session.get(url, timeout=10)
             
             if response.status_code == 200:
-                data = response.json()
-                return data.get('count', 0)
+                data = orjson.loads(response.content)
+                followers = data.get('count', 0)
+                with self._lock:
+                    self._foll_cache[user_id] = followers
+                return followers
             elif response.status_code == 404:
+                with self._lock:
+                    self._missing_cache[user_id] = True
                 return None
             elif response.status_code == 429:
-                # Rate limited - wait a bit and try once more
-                logger.info(f"Rate limited for user {user_id}, waiting 2 seconds...")
-                time.sleep(2)
-                
-                response = self.session.get(url, timeout=10)
-                if response.status_code == 200:
-                    data = response.json()
-                    return data.get('count', 0)
-                else:
-                    logger.warning(f"Still rate limited after retry for user {user_id}")
-                    return None
+                logger.warning("Still rate limited after retries for user %s", user_id)
+                return None
             else:
-                logger.warning(f"Followers API returned status {response.status_code} for user {user_id}")
+                logger.warning("Followers API returned status %s for user %s", response.status_code, user_id)
                 return None
         except Exception as e:
-            logger.warning(f"Failed to get followers from API for user {user_id}: {str(e)}")
+            logger.warning("Failed to get followers from API for user %s: %s", user_id, e)
             return None
     
     def _scrape_user_profile(self, user_id: int) -> Dict[str, Any]:
@@ -133,28 +374,66 @@ class RobloxScraper:
         try:
             # Construct profile URL
             url = self.base_url.format(user_id)
-            logger.debug(f"Scraping URL: {url}")
-            
-            # Make request with timeout
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
+            logger.debug("Scraping URL: %s", url)
             
-            # Parse HTML
-            soup = BeautifulSoup(response.content, 'html.parser')
+            # Stream the page with timeout, stopping as soon as the follower
+            # JSON shows up so the rest of the page is never downloaded
+            response = self.session.get(url, timeout=10, stream=True)
+            try:
+                # Trust the status code before reading any of the body
+                if response.status_code == 404:
+                    return {
+                        'success': False,
+                        'error': 'User not found',
+                        'user_id': user_id
+                    }
+                response.raise_for_status()
+                
+                followers = None
+                buf = bytearray()
+                scan_from = 0
+                for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+                    buf += chunk
+                    match = FOLLOWER_SCRIPT_BYTES_RE.search(buf, scan_from)
+                    # A match running up to the end of the buffer may have
+                    # its digits cut off by the chunk boundary
+                    if match and match.end() < len(buf):
+                        followers = int(match.group('count'))
+                        break
+                    # Resume at the unfinished match, or a little before the
+                    # end so matches that straddle the next boundary are found
+                    scan_from = match.start() if match else max(0, len(buf) - 64)
+                else:
+                    # The page is complete, so a match at its very end is too
+                    match = FOLLOWER_SCRIPT_BYTES_RE.search(buf, scan_from)
+                    if match:
+                        followers = int(match.group('count'))
+            finally:
+                response.close()
             
-            # Check if user exists by looking for error indicators
-            if "User not found" in response.text or response.status_code == 404:
+            # Check if user exists by looking for error indicators, which
+            # appear near the top of the page
+            if b"User not found" in buf[:NOT_FOUND_SCAN_BYTES]:
                 return {
                     'success': False,
                     'error': 'User not found',
                     'user_id': user_id
                 }
             
-            # Extract username
-            username = self._extract_username(soup)
+            content = bytes(buf)
+            tree = None
             
-            # Extract follower count
-            followers = self._extract_followers(soup)
+            # Extract username from the page head, parsing HTML only if that fails
+            username = self._extract_username_from_head(content[:HEAD_SCAN_BYTES])
+            if username is None:
+                tree = lxml.html.fromstring(content)
+                username = self._extract_username(tree)
+            
+            # Extract follower count, unless the streamed scan already found it
+            if followers is None:
+                if tree is None:
+                    tree = lxml.html.fromstring(content)
+                followers = self._extract_followers(tree)
             
             if followers is None:
                 return {
@@ -169,20 +448,20 @@ class RobloxScraper:
                 'user_id': user_id,
                 'username': username,
                 'followers': followers,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': self._timestamp()
             }
             
             return result
             
         except requests.exceptions.Timeout:
-            logger.error(f"Timeout while scraping user {user_id}")
+            logger.error("Timeout while scraping user %s", user_id)
             return {
                 'success': False,
                 'error': 'Request timeout - Roblox servers may be slow',
                 'user_id': user_id
             }
         except requests.exceptions.ConnectionError:
-            logger.error(f"Connection error while scraping user {user_id}")
+            logger.error("Connection error while scraping user %s", user_id)
             return {
                 'success': False,
                 'error': 'Unable to connect to Roblox servers',
@@ -195,27 +474,56 @@ class RobloxScraper:
                     'error': 'User not found',
                     'user_id': user_id
                 }
-            logger.error(f"HTTP error {e.response.status_code} while scraping user {user_id}")
+            logger.error("HTTP error %s while scraping user %s", e.response.status_code, user_id)
             return {
                 'success': False,
                 'error': f'HTTP error: {e.response.status_code}',
                 'user_id': user_id
             }
         except Exception as e:
-            logger.error(f"Unexpected error while scraping user {user_id}: {str(e)}")
+            logger.error("Unexpected error while scraping user %s: %s", user_id, e)
             return {
                 'success': False,
                 'error': 'An unexpected error occurred during scraping',
                 'user_id': user_id
             }
     
-    def _extract_username(self, soup: BeautifulSoup) -> str:
+    def _extract_username_from_head(self, head: bytes) -> Optional[str]:
+        """Extract username from the title and meta tags in the raw page head"""
+        # Title format is usually "Username - Roblox"
+        match = TITLE_RE.search(head)
+        if match:
+            title_text = html.unescape(match.group(1).decode('utf-8', errors='replace')).strip()
+            if ' - Roblox' in title_text:
+                username = title_text.replace(' - Roblox', '').strip()
+                if username and len(username) < 50:
+                    return username
+        
+        match = META_DESC_RE.search(head)
+        if match:
+            content = html.unescape(match.group('content').decode('utf-8', errors='replace'))
+            if ' is one of the millions' in content:
+                username = content.split(' is one of the millions')[0].strip()
+                if username and len(username) < 50:
+                    return username
+        
+        match = OG_TITLE_RE.search(head)
+        if match:
+            content = html.unescape(match.group('content').decode('utf-8', errors='replace'))
+            if "'s Profile" in content:
+                username = content.replace("'s Profile", '').strip()
+                if username and len(username) < 50:
+                    return username
+        
+        return None
+    
+    def _extract_username(self, tree: lxml.html.HtmlElement) -> str:
         """Extract username from profile page"""
         try:
             # Strategy 1: Extract from page title
-            title = soup.find('title')
+            title = tree.findtext('.//title')
             if title:
-                title_text = title.get_text().strip()
+                title_text = title.strip()
                 # Title format is usually "Username - Roblox"
                 if ' - Roblox' in title_text:
                     username = title_text.replace(' - Roblox', '').strip()
@@ -224,9 +532,9 @@ class RobloxScraper:
             
             # Strategy 2: Extract from meta description
             try:
-                meta_desc = soup.find('meta', {'name': 'description'})
+                meta_desc = tree.xpath('//meta[@name="description"]/@content')
                 if meta_desc:
-                    content = meta_desc.get('content', '')
+                    content = meta_desc[0]
                     if content and ' is one of the millions' in str(content):
                         username = str(content).split(' is one of the millions')[0].strip()
                         if username and len(username) < 50:
@@ -236,9 +544,9 @@ class RobloxScraper:
             
             # Strategy 3: Extract from Open Graph title
             try:
-                og_title = soup.find('meta', {'property': 'og:title'})
+                og_title = tree.xpath('//meta[@property="og:title"]/@content')
                 if og_title:
-                    content = og_title.get('content', '')
+                    content = og_title[0]
                     if content and "'s Profile" in str(content):
                         username = str(content).replace("'s Profile", '').strip()
                         if username and len(username) < 50:
@@ -247,31 +555,18 @@ class RobloxScraper:
                 pass
             
             # Strategy 4: Try common selectors for username
-            selectors = [
-                'h1[data-testid="profile-display-name"]',
-                '.profile-display-name',
-                '.profile-name h1',
-                'h1.profile-name',
-                '.header-title h1',
-                '.profile-header h1',
-                '.profile-card h1'
-            ]
-            
-            for selector in selectors:
-                try:
-                    element = soup.select_one(selector)
-                    if element:
-                        username = element.get_text().strip()
-                        if username and len(username) < 50:
-                            return username
-                except:
-                    continue
+            try:
+                for element in USERNAME_SELECTOR(tree):
+                    username = element.text_content().strip()
+                    if username and len(username) < 50:
+                        return username
+            except:
+                pass
             
             # Strategy 5: Look for any h1 that might contain the username
             try:
-                h1_elements = soup.find_all('h1')
-                for h1 in h1_elements:
-                    text = h1.get_text().strip()
+                for h1_text in tree.xpath('//h1/text()'):
+                    text = h1_text.strip()
                     if text and len(text) < 50 and not any(word in text.lower() for word in ['roblox', 'profile', 'error', 'not found']):
                         return text
             except:
@@ -279,110 +574,63 @@ class RobloxScraper:
                     
             return "Unknown"
         except Exception as e:
-            logger.warning(f"Could not extract username: {str(e)}")
+            logger.warning("Could not extract username: %s", e)
             return "Unknown"
     
-    def _extract_followers(self, soup: BeautifulSoup) -> Optional[int]:
+    def _extract_followers(self, tree: lxml.html.HtmlElement) -> Optional[int]:
         """Extract follower count from profile page"""
         try:
             # Strategy 1: Look in script tags for JSON data with follower information
-            script_tags = soup.find_all('script')
-            for script in script_tags:
-                script_content = None
-                if hasattr(script, 'string') and script.string:
-                    script_content = script.string
-                elif script.get_text():
-                    script_content = script.get_text()
-                
-                if script_content:
-                    # Look for follower data in JavaScript variables or JSON
-                    follower_patterns = [
-                        r'"[Ff]ollowersCount":\s*(\d+)',
-                        r'"[Ff]ollowers":\s*(\d+)',
-                        r'"[Ff]ollowerCount":\s*(\d+)',
-                        r'followersCount["\']:\s*(\d+)',
-                        r'followers["\']:\s*(\d+)',
-                        r'FollowersCount["\']:\s*(\d+)',
-                    ]
-                    
-                    for pattern in follower_patterns:
-                        matches = re.findall(pattern, script_content)
-                        if matches:
-                            return int(matches[0])
+            # (scripts that never mention followers are skipped)
+            for script_content in tree.xpath('//script[contains(text(), "ollower")]/text()'):
+                # Look for follower data in JavaScript variables or JSON
+                match = FOLLOWER_SCRIPT_RE.search(script_content)
+                if match:
+                    return int(match.group('count'))
             
             # Strategy 2: Look for specific data attributes or classes in newer Roblox layout
-            follower_selectors = [
-                '[data-testid="followers-count"]',
-                '[data-testid="follower-count"]',
-                '.followers-count',
-                '.follower-count',
-                '.profile-stats-followers',
-                '.followers .stat-value',
-                '.stat-followers .stat-value',
-                '.profile-stat-followers',
-                '[class*="follower"] .text-label',
-                '[class*="follower"] .font-header-2'
-            ]
+            for element in FOLLOWER_SELECTOR(tree):
+                match = NUMBER_TOKEN_RE.search(element.text_content())
+                if match:
+                    follower_count = self._parse_number(match.group())
+                    if follower_count >= 0:
+                        return follower_count
             
-            for selector in follower_selectors:
-                elements = soup.select(selector)
-                for element in elements:
-                    text = element.get_text().strip()
-                    if text and re.search(r'\d', text):
-                        follower_count = self._parse_number(text)
-                        if follower_count >= 0:
-                            return follower_count
+            # Strategies 3-5 scan the visible page text, built once. Script,
+            # style and attribute content is left out since it is full of
+            # unrelated numbers.
+            page_text = ' '.join(tree.xpath(VISIBLE_TEXT_XPATH))
             
             # Strategy 3: Look for text patterns that indicate followers
-            page_text = soup.get_text()
-            text_patterns = [
-                r'(\d+(?:,\d+)*)\s*[Ff]ollowers?',
-                r'[Ff]ollowers?:\s*(\d+(?:,\d+)*)',
-                r'(\d+(?:,\d+)*)\s*people\s+follow',
-                r'(\d+(?:,\d+)*)\s*[Ff]ollowing\s+you',
-                r'(\d+(?:\.\d*)?[KkMmBb]?)\s*[Ff]ollowers?'
-            ]
-            
-            for pattern in text_patterns:
-                matches = re.findall(pattern, page_text)
-                if matches:
-                    for match in matches:
-                        follower_count = self._parse_number(match)
-                        if follower_count >= 0:
-                            return follower_count
+            for pattern in FOLLOWER_TEXT_RES:
+                match = pattern.search(page_text)
+                if match:
+                    follower_count = self._parse_number(match.group(1))
+                    if follower_count >= 0:
+                        return follower_count
             
             # Strategy 4: Look for numbers near follower-related text
-            follower_context_patterns = [
-                r'(?i:followers?|following)[^\d]*(\d+(?:,\d+)*|\d+(?:\.\d+)?[kmb]?)',
-                r'(\d+(?:,\d+)*|\d+(?:\.\d+)?[kmb]?)[^\d]*(?i:followers?|following)'
-            ]
-            
-            for pattern in follower_context_patterns:
-                matches = re.findall(pattern, page_text)
-                if matches:
-                    for match in matches:
-                        follower_count = self._parse_number(match)
-                        if follower_count >= 0:
-                            return follower_count
+            for pattern in FOLLOWER_CONTEXT_RES:
+                match = pattern.search(page_text)
+                if match:
+                    follower_count = self._parse_number(match.group(1))
+                    if follower_count >= 0:
+                        return follower_count
             
             # Strategy 5: Last resort - look for reasonable numbers that might be follower counts
             # Only use this if we found very specific indicators
-            if 'profile' in page_text.lower() and 'roblox' in page_text.lower():
-                number_patterns = [
-                    r'\b(\d{1,3}(?:,\d{3})+)\b',  # Numbers with commas (like 1,234)
-                    r'\b(\d+(?:\.\d+)?[KkMmBb])\b'  # Numbers with K/M/B suffix
-                ]
-                
+            lower_text = page_text.lower()
+            if 'profile' in lower_text and 'roblox' in lower_text:
                 potential_followers = []
-                for pattern in number_patterns:
-                    matches = re.findall(pattern, page_text)
+                for pattern in (NUMBER_COMMA_RE, NUMBER_SUFFIX_RE):
+                    matches = pattern.findall(page_text)
                     for match in matches:
                         count = self._parse_number(match)
                         if 0 <= count <= 100000000:  # Reasonable range for followers
                             potential_followers.append(count)
                 
                 if potential_followers:
-                    logger.warning(f"Using heuristic follower count detection")
+                    logger.warning("Using heuristic follower count detection")
                     # Return the most reasonable number (prefer larger numbers that are more likely to be follower counts)
                     potential_followers.sort(reverse=True)
                     return potential_followers[0]
@@ -390,46 +638,49 @@ class RobloxScraper:
             return None
             
         except Exception as e:
-            logger.error(f"Error extracting followers: {str(e)}")
+            logger.error("Error extracting followers: %s", e)
             return None
     
     def _parse_number(self, text: str) -> int:
-        """Parse a number string that might contain commas"""
+        """Parse a number string that might contain commas or a k, m, b suffix"""
+        text = text.strip()
+        multiplier = NUMBER_MULTIPLIERS.get(text[-1:].lower(), 1)
+        if multiplier != 1:
+            text = text[:-1]
+        text = text.replace(',', '')
         try:
-            # Remove commas and other non-digit characters except for k, m, b suffixes
-            text = text.strip().lower()
-            
-            # Handle k, m, b suffixes
-            multiplier = 1
-            if text.endswith('k'):
-                multiplier = 1000
-                text = text[:-1]
-            elif text.endswith('m'):
-                multiplier = 1000000
-                text = text[:-1]
-            elif text.endswith('b'):
-                multiplier = 1000000000
-                text = text[:-1]
-            
-            # Remove commas and convert to int
-            number_str = re.sub(r'[^\d.]', '', text)
-            if '.' in number_str:
-                return int(float(number_str) * multiplier)
-            else:
-                return int(number_str) * multiplier
-        except (ValueError, AttributeError):
+            if '.' in text:
+                return int(float(text) * multiplier)
+            return int(text) * multiplier
+        except ValueError:
             return 0
     
     def clear_cache(self) -> None:
-        """Cache system has been removed for real-time data"""
-        logger.info("Cache system removed - all requests now fetch real-time data")
+        """Clear the username, follower and not-found caches"""
+        with self._lock:
+            self._name_cache.clear()
+            self._foll_cache.clear()
+            self._missing_cache.clear()
     
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
+        caches = {
+            'usernames': self._name_cache,
+            'followers': self._foll_cache,
+            'not_found': self._missing_cache
+        }
+        stats = {}
+        with self._lock:
+            for name, cache in caches.items():
+                cache.expire()
+                stats[name] = {
+                    'entries': len(cache),
+                    'maxsize': cache.maxsize,
+                    'currsize': cache.currsize,
+                    'ttl': cache.ttl
+                }
         return {
-            'message': 'Cache system has been removed for real-time follower tracking',
-            'total_entries': 0,
-            'valid_entries': 0,
-            'expired_entries': 0,
-            'cache_enabled': False
+            'total_entries': sum(cache['entries'] for cache in stats.values()),
+            'cache_enabled': True,
+            'caches': stats
         }